@@ -4,18 +4,140 @@ Analysis module for CORD-19 dataset
 
 import pandas as pd
 import numpy as np
-from collections import Counter
-import re
+import pyarrow as pa
+import pyarrow.compute as pc
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import inspect
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Number of titles tokenized per Arrow batch
+TITLE_CHUNK_SIZE = 100_000
+
+# Common stopwords to exclude from word analysis
+_STOPWORDS = frozenset({
+    'the', 'and', 'of', 'in', 'to', 'a', 'is', 'for', 'on', 'with', 
+    'as', 'by', 'at', 'an', 'are', 'from', 'or', 'this', 'that', 'be',
+    'was', 'will', 'have', 'has', 'been', 'can', 'could', 'would',
+    'should', 'may', 'might', 'must', 'shall', 'covid', 'coronavirus',
+    'sars', 'cov', '19', '2019', '2020', '2021', '2022', '2023'
+})
+
+# Stopword lookup for pc.is_in, built once instead of per call
+_STOPWORD_LOOKUP = pc.SetLookupOptions(value_set=pa.array(sorted(_STOPWORDS), type=pa.string()),
+                                       skip_nulls=True)
+
+# Punctuation replacement, equivalent to re.sub(r'[^\w\s]', ' ', ...)
+_PUNCT_OPTIONS = pc.ReplaceSubstringOptions(r'[^\p{L}\p{N}_\s]', ' ')
+
+def _memoize(method):
+    """
+    Cache a DataAnalyzer method's result per call arguments
+    
+    Arguments are bound against the signature so that f(), f(20) and f(n=20)
+    share one entry. The cache is cleared whenever the analyzer's df is
+    reassigned; returned frames are shared, so callers must not modify them.
+    """
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,) + tuple(bound.arguments.values())[1:]
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+    
+    return wrapper
+
+def _count_int_values(values):
+    """
+    Count occurrences of each integer in a Series with one np.bincount pass
+    
+    Args:
+        values (pd.Series): Integer-valued series (missing values are ignored)
+        
+    Returns:
+        pd.Series: Counts indexed by value in ascending order, zero counts dropped
+    """
+    arr = values.dropna().to_numpy(dtype='int64')
+    if arr.size == 0:
+        return pd.Series(dtype='int64')
+    
+    lo = arr.min()
+    counts = np.bincount(arr - lo)
+    present = np.flatnonzero(counts)
+    return pd.Series(counts[present], index=present + lo)
+
+def _count_distinct(values):
+    """
+    Count distinct non-null values without hashing Python strings
+    
+    Categoricals are counted from their integer codes (unused categories left
+    behind by filtering are not counted); other columns use Arrow's
+    count_distinct kernel.
+    
+    Args:
+        values (pd.Series): Column to count
+        
+    Returns:
+        int: Number of distinct non-null values
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        observed = np.bincount(codes[codes >= 0], minlength=len(values.cat.categories))
+        return int(np.count_nonzero(observed))
+    
+    arr = pa.array(values, from_pandas=True)
+    if pa.types.is_null(arr.type):
+        return 0
+    return pc.count_distinct(arr).as_py()
+
+def count_title_words(titles, min_length=3):
+    """
+    Tokenize titles in Arrow and count their words
+    
+    Args:
+        titles (pd.Series): Titles to tokenize (missing values are ignored)
+        min_length (int): Minimum word length to consider
+        
+    Returns:
+        pd.Series: Word counts indexed by word, in first-seen order
+    """
+    chunk = pa.array(titles, type=pa.string(), from_pandas=True)
+    
+    # Convert to lowercase, remove punctuation and split into words
+    chunk = pc.utf8_lower(chunk)
+    chunk = pc.replace_substring_regex(chunk, options=_PUNCT_OPTIONS)
+    tokens = pc.list_flatten(pc.utf8_split_whitespace(chunk))
+    
+    # Filter words and count them inside Arrow; the cheap length check
+    # runs first so the stopword hash lookup sees fewer tokens
+    tokens = tokens.filter(pc.greater_equal(pc.utf8_length(tokens), min_length))
+    tokens = tokens.filter(pc.invert(pc.is_in(tokens, options=_STOPWORD_LOOKUP)))
+    counts = pc.value_counts(tokens)
+    return pd.Series(counts.field('counts').to_numpy(),
+                     index=counts.field('values').to_pandas())
+
 class DataAnalyzer:
     """Class to perform analysis on CORD-19 data"""
     
     def __init__(self, df):
         self.df = df
+    
+    @property
+    def df(self):
+        return self._df
+    
+    @df.setter
+    def df(self, df):
+        self._df = df
+        self._cache = {}
         
+    @_memoize
     def analyze_publications_by_year(self):
         """
         Analyze publication trends by year
@@ -27,7 +149,7 @@ class DataAnalyzer:
             logger.warning("No year column found. Cannot analyze by year.")
             return pd.DataFrame()
         
-        yearly_counts = self.df['publish_time_year'].value_counts().sort_index()
+        yearly_counts = _count_int_values(self.df['publish_time_year'])
         
         result_df = pd.DataFrame({
             'year': yearly_counts.index,
@@ -37,6 +159,7 @@ class DataAnalyzer:
         logger.info(f"Analyzed publications across {len(result_df)} years")
         return result_df
     
+    @_memoize
     def get_top_journals(self, n=20):
         """
         Get top journals publishing COVID-19 research
@@ -51,7 +174,9 @@ class DataAnalyzer:
         
         for col in journal_cols:
             if col in self.df.columns:
-                journal_counts = self.df[col].value_counts().head(n)
+                journal_counts = self.df[col].value_counts()
+                # Categoricals report unused categories with a zero count
+                journal_counts = journal_counts[journal_counts > 0].head(n)
                 
                 result_df = pd.DataFrame({
                     'journal': journal_counts.index,
@@ -67,6 +192,7 @@ class DataAnalyzer:
         logger.warning("No journal column found")
         return pd.DataFrame()
     
+    @_memoize
     def analyze_title_words(self, n=30, min_length=3):
         """
         Analyze most frequent words in paper titles
@@ -82,26 +208,46 @@ class DataAnalyzer:
             logger.warning("No title column found")
             return pd.DataFrame()
         
-        # Combine all titles
-        all_titles = ' '.join(self.df['title'].fillna('').astype(str))
+        # Tokenize and count titles batch by batch on a thread pool; the Arrow
+        # kernels release the GIL, so batches are processed in parallel
+        starts = range(0, len(self.df), TITLE_CHUNK_SIZE)
         
-        # Basic text preprocessing
-        # Convert to lowercase and remove punctuation
-        all_titles = re.sub(r'[^\w\s]', ' ', all_titles.lower())
+        with ThreadPoolExecutor() as pool:
+            chunk_counts = list(pool.map(
+                lambda start: self._count_chunk_words(start, min_length), starts
+            ))
         
-        # Split into words and filter
-        words = [word for word in all_titles.split() 
-                if len(word) >= min_length and word not in self._get_stopwords()]
+        if not chunk_counts:
+            return pd.DataFrame(columns=['word', 'frequency'])
         
-        # Count words
-        word_counts = Counter(words)
-        most_common = word_counts.most_common(n)
+        word_counts = pd.concat(chunk_counts).groupby(level=0, sort=False).sum()
         
-        result_df = pd.DataFrame(most_common, columns=['word', 'frequency'])
+        # Stable sort keeps ties in first-seen order, like Counter.most_common
+        most_common = word_counts.sort_values(ascending=False, kind='stable').head(n)
+        
+        result_df = pd.DataFrame({
+            'word': most_common.index,
+            'frequency': most_common.values
+        })
         
-        logger.info(f"Analyzed {len(words)} words, returning top {len(result_df)}")
+        logger.info(f"Analyzed {word_counts.sum()} words, returning top {len(result_df)}")
         return result_df
     
+    def _count_chunk_words(self, start, min_length):
+        """
+        Tokenize one batch of TITLE_CHUNK_SIZE titles and count its words
+        
+        Args:
+            start (int): Row offset of the batch
+            min_length (int): Minimum word length to consider
+            
+        Returns:
+            pd.Series: Word counts indexed by word, in first-seen order
+        """
+        titles = self.df['title'].iloc[start:start + TITLE_CHUNK_SIZE]
+        return count_title_words(titles, min_length)
+    
+    @_memoize
     def analyze_source_distribution(self):
         """
         Analyze distribution of papers by source
@@ -114,7 +260,11 @@ class DataAnalyzer:
         for col in source_cols:
             if col in self.df.columns and not self.df[col].isna().all():
                 # Create source categories
-                source_counts = self.df[col].fillna('Unknown').value_counts()
+                sources = self.df[col]
+                if isinstance(sources.dtype, pd.CategoricalDtype) and 'Unknown' not in sources.cat.categories:
+                    sources = sources.cat.add_categories('Unknown')
+                source_counts = sources.fillna('Unknown').value_counts()
+                source_counts = source_counts[source_counts > 0]
                 
                 result_df = pd.DataFrame({
                     'source': source_counts.index,
@@ -136,17 +286,18 @@ class DataAnalyzer:
         """
         stats = {
             'total_papers': len(self.df),
-            'unique_titles': self.df['title'].nunique() if 'title' in self.df.columns else 0,
+            'unique_titles': _count_distinct(self.df['title']) if 'title' in self.df.columns else 0,
             'date_range': None,
             'avg_abstract_length': None,
             'total_journals': 0
         }
         
-        # Date range
+        # Date range: min and max in a single Arrow pass that skips nulls
         if 'publish_time_year' in self.df.columns:
-            years = self.df['publish_time_year'].dropna()
-            if not years.empty:
-                stats['date_range'] = f"{int(years.min())}-{int(years.max())}"
+            years = pa.array(self.df['publish_time_year'], from_pandas=True)
+            bounds = pc.min_max(years).as_py()
+            if bounds['min'] is not None:
+                stats['date_range'] = f"{int(bounds['min'])}-{int(bounds['max'])}"
         
         # Average abstract length
         if 'abstract_word_count' in self.df.columns:
@@ -156,26 +307,11 @@ class DataAnalyzer:
         journal_cols = ['journal', 'source_x']
         for col in journal_cols:
             if col in self.df.columns:
-                stats['total_journals'] = self.df[col].nunique()
+                stats['total_journals'] = _count_distinct(self.df[col])
                 break
         
         return stats
     
-    def _get_stopwords(self):
-        """
-        Get list of common stopwords to exclude from analysis
-        
-        Returns:
-            set: Set of stopwords
-        """
-        return {
-            'the', 'and', 'of', 'in', 'to', 'a', 'is', 'for', 'on', 'with', 
-            'as', 'by', 'at', 'an', 'are', 'from', 'or', 'this', 'that', 'be',
-            'was', 'will', 'have', 'has', 'been', 'can', 'could', 'would',
-            'should', 'may', 'might', 'must', 'shall', 'covid', 'coronavirus',
-            'sars', 'cov', '19', '2019', '2020', '2021', '2022', '2023'
-        }
-    
     def analyze_monthly_trends(self):
         """
         Analyze monthly publication trends
@@ -187,7 +323,7 @@ class DataAnalyzer:
             logger.warning("No month column found")
             return pd.DataFrame()
         
-        monthly_counts = self.df['publish_time_month'].value_counts().sort_index()
+        monthly_counts = _count_int_values(self.df['publish_time_month'])
         
         month_names = {
             1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
@@ -4,17 +4,29 @@ Data cleaning module for CORD-19 dataset analysis
 
 import pandas as pd
 import numpy as np
-import re
+import pyarrow as pa
+import pyarrow.feather as feather
+import os
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Copy-on-Write lets the cleaning steps share column buffers with the input
+# frame instead of copying them; it is always on from pandas 3.0
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+def _downcast_counts(counts):
+    """Store a count column in the narrowest integer dtype that holds its values"""
+    return pd.to_numeric(counts.astype('int64'), downcast='integer')
+
 class DataCleaner:
     """Class to handle data cleaning and preparation"""
     
     def __init__(self, df):
-        self.df = df.copy()
+        # Shallow copy: new columns are assigned, never written in place
+        self.df = df.copy(deep=False)
         self.cleaned_df = None
         
     def handle_missing_values(self, strategy='drop_high_missing'):
@@ -38,14 +50,20 @@ class DataCleaner:
             
             self.df = self.df.drop(columns=cols_to_drop)
         
-        # Fill remaining missing values strategically
-        for col in self.df.columns:
-            if self.df[col].dtype == 'object':
-                # Fill text columns with 'Unknown'
-                self.df[col].fillna('Unknown', inplace=True)
-            elif self.df[col].dtype in ['int64', 'float64']:
-                # Fill numerical columns with median
-                self.df[col].fillna(self.df[col].median(), inplace=True)
+        # Fill remaining missing values strategically, one pass per dtype
+        # Fill numerical columns with median
+        num_cols = self.df.select_dtypes(include=np.number).columns
+        self.df[num_cols] = self.df[num_cols].fillna(self.df[num_cols].median())
+        
+        # Categoricals need 'Unknown' registered before it can be filled
+        cat_cols = self.df.select_dtypes(include='category').columns
+        for col in cat_cols:
+            if 'Unknown' not in self.df[col].cat.categories:
+                self.df[col] = self.df[col].cat.add_categories('Unknown')
+        
+        # Fill text columns with 'Unknown'
+        text_cols = self.df.select_dtypes(include=['object', 'string']).columns.union(cat_cols, sort=False)
+        self.df[text_cols] = self.df[text_cols].fillna('Unknown')
         
         logger.info("Missing values handled")
         
@@ -61,16 +79,29 @@ class DataCleaner:
         for col in date_columns:
             if col in self.df.columns:
                 try:
-                    # Convert to datetime, handling various formats
-                    self.df[col] = pd.to_datetime(self.df[col], errors='coerce')
+                    # Convert to datetime: most CORD-19 dates are YYYY-MM-DD, so
+                    # parse those with a fixed format and only send the rest
+                    # (bare years, timestamps) through the ISO 8601 parser
+                    raw = self.df[col].astype('string[pyarrow]')
+                    dates = pd.to_datetime(raw, format='%Y-%m-%d', errors='coerce')
+                    residual = dates.isna() & raw.notna()
+                    if residual.any():
+                        # Keep timestamps in their local wall time: drop any UTC
+                        # offset rather than converting, so the year matches the
+                        # leading digits of the raw value
+                        wall_time = raw[residual].str.replace(
+                            r'(\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)\s*(?:Z|[+-]\d{2}:?\d{2})$', r'\1', regex=True
+                        )
+                        dates[residual] = pd.to_datetime(wall_time, format='ISO8601', errors='coerce')
+                    self.df[col] = dates
                     
                     # Extract year for analysis
                     year_col = f"{col}_year"
-                    self.df[year_col] = self.df[col].dt.year
+                    self.df[year_col] = dates.dt.year.astype('Int16')
                     
-                    # Extract month for seasonal analysis
+                    # Extract month for seasonal analysis; bare years carry no month
                     month_col = f"{col}_month"
-                    self.df[month_col] = self.df[col].dt.month
+                    self.df[month_col] = dates.dt.month.astype('Int8').mask(raw.str.len() == 4)
                     
                     logger.info(f"Processed date column: {col}")
                     
@@ -85,20 +116,22 @@ class DataCleaner:
         
         # Abstract word count
         if 'abstract' in self.df.columns:
-            self.df['abstract_word_count'] = self.df['abstract'].apply(
-                lambda x: len(str(x).split()) if pd.notna(x) else 0
+            self.df['abstract_word_count'] = _downcast_counts(
+                self.df['abstract'].fillna('').str.split().str.len()
             )
         
         # Title word count
         if 'title' in self.df.columns:
-            self.df['title_word_count'] = self.df['title'].apply(
-                lambda x: len(str(x).split()) if pd.notna(x) else 0
+            self.df['title_word_count'] = _downcast_counts(
+                self.df['title'].fillna('').str.split().str.len()
             )
         
         # Number of authors (if authors column exists)
         if 'authors' in self.df.columns:
-            self.df['author_count'] = self.df['authors'].apply(
-                lambda x: len(str(x).split(';')) if pd.notna(x) and str(x) != 'Unknown' else 0
+            authors = self.df['authors']
+            has_authors = authors.notna() & (authors != 'Unknown')
+            self.df['author_count'] = _downcast_counts(
+                authors.fillna('').str.count(';').add(1).where(has_authors, 0)
             )
         
         logger.info("Text features created")
@@ -114,15 +147,16 @@ class DataCleaner:
         
         for col in text_columns:
             if col in self.df.columns:
-                # Remove extra whitespace and normalize
-                self.df[col] = self.df[col].apply(
-                    lambda x: ' '.join(str(x).split()) if pd.notna(x) else ''
-                )
+                # Arrow-backed strings run the regexes in compiled RE2 kernels
+                text = self.df[col].astype('string[pyarrow]').fillna('')
+                
+                # Remove non-printable characters, keeping whitespace as a word break.
+                # RE2's \s lacks \v, \x1c-\x1f and \x85, which str.split() treats
+                # as whitespace, so they are listed explicitly
+                text = text.str.replace(r'[^\x20-\x7E\s\p{Z}\x0b\x1c-\x1f\x85]+', '', regex=True)
                 
-                # Remove non-printable characters
-                self.df[col] = self.df[col].apply(
-                    lambda x: re.sub(r'[^\x20-\x7E]', '', str(x))
-                )
+                # Remove extra whitespace and normalize
+                self.df[col] = text.str.replace(r'[\s\p{Z}\x0b\x1c-\x1f\x85]+', ' ', regex=True).str.strip()
         
         logger.info("Text columns cleaned")
     
@@ -135,8 +169,15 @@ class DataCleaner:
         """
         logger.info(f"Filtering data for years {year_range[0]}-{year_range[1]}")
         
-        # Filter by year if publish_time_year exists
-        if 'publish_time_year' in self.df.columns:
+        # Filter by year if publish_time_year exists, unless DataLoader already
+        # pushed the same range down into the Parquet scan
+        if self.df.attrs.get('year_range') == tuple(year_range):
+            # Rows were kept on the year prefix; drop those whose full date
+            # did not parse so the result matches the in-memory filter
+            if 'publish_time_year' in self.df.columns:
+                self.df = self.df[self.df['publish_time_year'].notna()]
+            logger.info("Year range already applied at load time")
+        elif 'publish_time_year' in self.df.columns:
             initial_count = len(self.df)
             self.df = self.df[
                 (self.df['publish_time_year'] >= year_range[0]) & 
@@ -156,13 +197,27 @@ class DataCleaner:
             final_count = len(self.df)
             logger.info(f"Removed empty titles: {initial_count} to {final_count} rows")
     
-    def get_cleaned_data(self):
+    def get_cleaned_data(self, cache_path=None):
         """
         Apply all cleaning steps and return cleaned dataframe
         
+        Args:
+            cache_path (str): Optional Feather file. If it exists it is loaded
+                instead of re-running the cleaning steps; otherwise the cleaned
+                data is written there
+        
         Returns:
-            pd.DataFrame: Cleaned dataframe
+            pd.DataFrame: Cleaned dataframe with a fresh RangeIndex, whether or
+                not it came from the cache (shares buffers with self.df, not a copy)
         """
+        if cache_path and os.path.exists(cache_path):
+            logger.info(f"Loading cleaned data from {cache_path}")
+            # Map Arrow strings straight to string[pyarrow] instead of Python objects
+            string_dtypes = {pa.string(): pd.StringDtype('pyarrow'),
+                             pa.large_string(): pd.StringDtype('pyarrow')}
+            self.cleaned_df = feather.read_table(cache_path).to_pandas(types_mapper=string_dtypes.get)
+            return self.cleaned_df
+        
         logger.info("Starting comprehensive data cleaning...")
         
         # Apply all cleaning steps
@@ -172,8 +227,15 @@ class DataCleaner:
         self.clean_text_columns()
         self.filter_data()
         
-        self.cleaned_df = self.df.copy()
+        # Match the RangeIndex of a cache load; self.df is our own frame, so
+        # relabelling it in place avoids copying the columns
+        self.df.index = pd.RangeIndex(len(self.df))
+        self.cleaned_df = self.df
         
         logger.info(f"Data cleaning completed. Final shape: {self.cleaned_df.shape}")
         
+        if cache_path:
+            self.cleaned_df.to_feather(cache_path, compression='zstd')
+            logger.info(f"Saved cleaned data to {cache_path}")
+        
         return self.cleaned_df
\ No newline at end of file
@@ -4,50 +4,313 @@ Data loading module for CORD-19 dataset analysis
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import os
 import logging
 
+# The modules are imported both as the src package and flat from src/
+try:
+    from .analyzer import count_title_words
+except ImportError:
+    from analyzer import count_title_words
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columns loaded from the metadata, by the CSV and Parquet paths alike
+LOAD_COLUMNS = ['cord_uid', 'title', 'abstract', 'authors', 'publish_time',
+                'journal', 'source_x', 'license']
+
+# Low-cardinality string columns stored as categoricals
+CATEGORICAL_COLUMNS = ['journal', 'source_x', 'license']
+
+# Dtypes for the loaded CSV columns; publish_time stays a string because
+# CORD-19 mixes YYYY-MM-DD and YYYY (see DataCleaner.prepare_dates)
+CSV_DTYPES = {col: 'category' if col in CATEGORICAL_COLUMNS else 'string[pyarrow]'
+              for col in LOAD_COLUMNS}
+
+def _arrow_dtype(arrow_type):
+    """Map Parquet columns to the dtypes the CSV path produces"""
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype('pyarrow')
+    if pa.types.is_dictionary(arrow_type):
+        return None  # default conversion gives a categorical like read_csv
+    return pd.ArrowDtype(arrow_type)
+
 class DataLoader:
     """Class to handle loading and basic exploration of CORD-19 metadata"""
     
     def __init__(self, data_path="data/metadata.csv"):
         self.data_path = data_path
+        self.parquet_path = os.path.splitext(data_path)[0] + '.parquet'
         self.df = None
         
-    def load_data(self, sample_size=None):
+    def load_data(self, sample_size=None, year_range=None):
         """
-        Load the CORD-19 metadata CSV file
+        Load the CORD-19 metadata, preferring the Parquet copy when present
         
         Args:
             sample_size (int): If specified, load only a sample of this size
+            year_range (tuple): (start_year, end_year) to push down into the
+                Parquet scan; recorded in df.attrs so DataCleaner.filter_data
+                can skip it. Ignored for CSV input.
         
         Returns:
             pd.DataFrame: Loaded dataframe
         """
+        if os.path.exists(self.parquet_path):
+            filters = None
+            if year_range and 'publish_time_year' in pq.read_schema(self.parquet_path).names:
+                year = ds.field('publish_time_year')
+                filters = (year >= year_range[0]) & (year <= year_range[1])
+            
+            self.load_parquet(filters=filters, sample_size=sample_size)
+            if filters is not None:
+                self.df.attrs['year_range'] = tuple(year_range)
+            return self.df
+        
         try:
             if not os.path.exists(self.data_path):
                 raise FileNotFoundError(f"Data file not found: {self.data_path}")
             
             logger.info(f"Loading data from {self.data_path}")
             
-            # Load data with error handling for large files
+            # Only parse the columns we use, with their final dtypes
+            header = pd.read_csv(self.data_path, nrows=0).columns
+            usecols = [c for c in CSV_DTYPES if c in header]
+            dtypes = {c: CSV_DTYPES[c] for c in usecols}
+            
+            # Load data with error handling for large files; the pyarrow
+            # engine is multithreaded but cannot stop after nrows
+            if sample_size:
+                self.df = pd.read_csv(self.data_path, usecols=usecols, dtype=dtypes,
+                                      nrows=sample_size)
+                logger.info(f"Loaded sample of {sample_size} rows")
+            else:
+                self.df = pd.read_csv(self.data_path, usecols=usecols, dtype=dtypes,
+                                      engine='pyarrow')
+                logger.info(f"Loaded full dataset")
+            
+            # The two engines order usecols differently; match LOAD_COLUMNS
+            self.df = self.df[usecols]
+            self._encode_categoricals()
+            return self.df
+            
+        except Exception as e:
+            logger.error(f"Error loading data: {str(e)}")
+            raise
+    
+    def load_parquet(self, columns=None, filters=None, sample_size=None):
+        """
+        Load the Parquet copy of the metadata with PyArrow-backed dtypes
+        
+        Args:
+            columns (list): Columns to read; defaults to LOAD_COLUMNS
+            filters (pyarrow.dataset.Expression): Row filter pushed down to the scan
+            sample_size (int): If specified, load only a sample of this size
+        
+        Returns:
+            pd.DataFrame: Loaded dataframe
+        """
+        try:
+            if not os.path.exists(self.parquet_path):
+                raise FileNotFoundError(f"Parquet file not found: {self.parquet_path}")
+            
+            logger.info(f"Loading data from {self.parquet_path}")
+            
+            dataset = ds.dataset(self.parquet_path, format="parquet")
+            
+            # Only materialize the columns the CSV path loads, in the same order
+            if columns is None:
+                columns = [c for c in LOAD_COLUMNS if c in dataset.schema.names]
+            
             if sample_size:
-                self.df = pd.read_csv(self.data_path, nrows=sample_size)
+                table = dataset.head(sample_size, columns=columns, filter=filters)
                 logger.info(f"Loaded sample of {sample_size} rows")
             else:
-                self.df = pd.read_csv(self.data_path)
+                table = dataset.to_table(columns=columns, filter=filters)
                 logger.info(f"Loaded full dataset")
             
+            # Dictionary-encode in Arrow so categoricals come out like read_csv's
+            for col in CATEGORICAL_COLUMNS:
+                if col in table.column_names:
+                    index = table.column_names.index(col)
+                    table = table.set_column(index, col, pc.dictionary_encode(table[col]))
+            
+            self.df = table.to_pandas(types_mapper=_arrow_dtype)
+            self._encode_categoricals()
             return self.df
             
         except Exception as e:
             logger.error(f"Error loading data: {str(e)}")
             raise
     
+    def convert_csv_to_parquet(self, block_size=64 * 1024**2):
+        """
+        One-time conversion of the metadata CSV to a zstd-compressed Parquet file
+        
+        Args:
+            block_size (int): Bytes of CSV to parse per chunk
+        
+        Returns:
+            str: Path of the written Parquet file
+        """
+        if not os.path.exists(self.data_path):
+            raise FileNotFoundError(f"Data file not found: {self.data_path}")
+        
+        logger.info(f"Converting {self.data_path} to {self.parquet_path}")
+        
+        # Read the header once so every column can be typed as string; type
+        # inference on the first chunk alone breaks on sparse columns
+        read_options = pv.ReadOptions(block_size=block_size)
+        with pv.open_csv(self.data_path, read_options=read_options) as reader:
+            names = reader.schema.names
+        
+        convert_options = pv.ConvertOptions(
+            column_types={name: pa.string() for name in names},
+            strings_can_be_null=True
+        )
+        
+        writer = None
+        try:
+            with pv.open_csv(self.data_path, read_options=read_options,
+                             convert_options=convert_options) as reader:
+                for batch in reader:
+                    table = pa.Table.from_batches([batch])
+                    
+                    # Year column lets load_data skip row groups by year range
+                    if 'publish_time' in names:
+                        year = pc.extract_regex(table['publish_time'], r'^(?P<year>\d{4})')
+                        year = pc.struct_field(year, 'year').cast(pa.int16())
+                        table = table.append_column('publish_time_year', year)
+                    
+                    if writer is None:
+                        writer = pq.ParquetWriter(self.parquet_path, table.schema,
+                                                  compression="zstd")
+                    writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        logger.info(f"Wrote {self.parquet_path}")
+        return self.parquet_path
+    
+    def stream_summary(self, chunksize=200_000, n_words=30):
+        """
+        Summarize the metadata CSV chunk by chunk without loading it whole
+        
+        Figures come from the raw file, not cleaned data: avg_abstract_length
+        averages the non-missing abstracts only, whereas
+        DataAnalyzer.get_basic_statistics also counts the 'Unknown' placeholders
+        DataCleaner fills in.
+        
+        Args:
+            chunksize (int): Number of rows parsed and reduced at a time
+            n_words (int): Number of top title words to return
+        
+        Returns:
+            dict: total_papers, date_range, avg_abstract_length, plus
+                  papers_by_year and papers_by_journal count Series and a
+                  title_words DataFrame of the most frequent title words
+        """
+        if not os.path.exists(self.data_path):
+            raise FileNotFoundError(f"Data file not found: {self.data_path}")
+        
+        logger.info(f"Streaming summary of {self.data_path}")
+        
+        header = pd.read_csv(self.data_path, nrows=0).columns
+        usecols = [c for c in ('publish_time', 'journal', 'abstract', 'title') if c in header]
+        dtypes = {c: CSV_DTYPES[c] for c in usecols}
+        
+        total_papers = 0
+        abstract_count = 0
+        abstract_words = 0
+        year_counts = []
+        journal_counts = []
+        word_counts = pd.Series(dtype='int64')
+        
+        # Peak memory is one chunk plus the small per-chunk count Series
+        for chunk in pd.read_csv(self.data_path, usecols=usecols, dtype=dtypes,
+                                 chunksize=chunksize):
+            total_papers += len(chunk)
+            
+            if 'publish_time' in chunk.columns:
+                years = chunk['publish_time'].str.extract(r'^(\d{4})', expand=False).dropna()
+                year_counts.append(years.astype('int16').value_counts())
+            
+            if 'journal' in chunk.columns:
+                counts = chunk['journal'].value_counts()
+                journal_counts.append(counts[counts > 0])
+            
+            if 'abstract' in chunk.columns:
+                abstracts = chunk['abstract'].dropna()
+                abstract_count += len(abstracts)
+                abstract_words += int(abstracts.str.split().str.len().sum())
+            
+            # Title words are merged into a running total as each chunk is read,
+            # keeping first-seen order for ties like analyze_title_words
+            if 'title' in chunk.columns:
+                counts = count_title_words(chunk['title'])
+                word_counts = pd.concat([word_counts, counts]).groupby(level=0, sort=False).sum()
+        
+        papers_by_year = self._merge_counts(year_counts).sort_index()
+        papers_by_journal = self._merge_counts(journal_counts).sort_values(ascending=False)
+        top_words = word_counts.sort_values(ascending=False, kind='stable').head(n_words)
+        
+        summary = {
+            'total_papers': total_papers,
+            'date_range': None,
+            'avg_abstract_length': None,
+            'papers_by_year': papers_by_year,
+            'papers_by_journal': papers_by_journal,
+            'title_words': pd.DataFrame({
+                'word': top_words.index,
+                'frequency': top_words.values
+            }),
+        }
+        
+        if not papers_by_year.empty:
+            summary['date_range'] = f"{papers_by_year.index.min()}-{papers_by_year.index.max()}"
+        
+        if abstract_count:
+            summary['avg_abstract_length'] = round(abstract_words / abstract_count, 1)
+        
+        logger.info(f"Summarized {total_papers} rows")
+        return summary
+    
+    @staticmethod
+    def _merge_counts(parts):
+        """
+        Sum per-chunk value counts into one Series
+        
+        Args:
+            parts (list): Count Series indexed by value
+        
+        Returns:
+            pd.Series: Total count per value
+        """
+        if not parts:
+            return pd.Series(dtype='int64')
+        
+        counts = pd.concat(parts)
+        return counts.groupby(counts.index.astype(object)).sum()
+    
+    def _encode_categoricals(self):
+        """
+        Dictionary-encode repetitive string columns so counts and equality
+        filters work on integer codes instead of hashing every string
+        """
+        for col in CATEGORICAL_COLUMNS:
+            if col in self.df.columns:
+                # Sorted categories, whichever file the column was read from
+                cats = self.df[col].astype('category')
+                self.df[col] = cats.cat.reorder_categories(cats.cat.categories.sort_values())
+    
     def basic_exploration(self):
         """
         Perform basic exploration of the loaded dataset
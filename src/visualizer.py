@@ -9,6 +9,7 @@ import numpy as np
 from wordcloud import WordCloud
 import plotly.express as px
 import plotly.graph_objects as go
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,16 @@ logger = logging.getLogger(__name__)
 plt.style.use('default')
 sns.set_palette("husl")
 
+def _truncate(labels, width):
+    """Shorten labels longer than width characters, marking the cut with '...'"""
+    labels = labels.astype(str)
+    return labels.mask(labels.str.len() > width, labels.str.slice(0, width) + '...')
+
+@functools.lru_cache(maxsize=None)
+def _gradient(cmap_name, n):
+    """Return n colors evenly spaced along a matplotlib colormap"""
+    return plt.get_cmap(cmap_name)(np.linspace(0, 1, n))
+
 class DataVisualizer:
     """Class to create visualizations for CORD-19 analysis"""
     
@@ -86,14 +97,12 @@ class DataVisualizer:
             bars = ax.barh(range(len(top_journals)), top_journals['publication_count'])
             
             # Color bars with gradient
-            colors = plt.cm.viridis(np.linspace(0, 1, len(bars)))
-            for bar, color in zip(bars, colors):
+            for bar, color in zip(bars, _gradient('viridis', len(bars))):
                 bar.set_color(color)
             
             # Set labels
             ax.set_yticks(range(len(top_journals)))
-            ax.set_yticklabels([j[:50] + '...' if len(j) > 50 else j 
-                               for j in top_journals['journal']], fontsize=10)
+            ax.set_yticklabels(_truncate(top_journals['journal'], 50), fontsize=10)
             
             # Add value labels on bars
             for i, (bar, count) in enumerate(zip(bars, top_journals['publication_count'])):
@@ -174,7 +183,7 @@ class DataVisualizer:
             # Create pie chart
             wedges, texts, autotexts = ax.pie(
                 plot_data['count'], 
-                labels=[s[:20] + '...' if len(s) > 20 else s for s in plot_data['source']],
+                labels=_truncate(plot_data['source'], 20),
                 autopct='%1.1f%%',
                 startangle=90
             )
@@ -205,8 +214,7 @@ class DataVisualizer:
             bars = ax.bar(monthly_data['month'], monthly_data['publication_count'])
             
             # Color bars with gradient
-            colors = plt.cm.coolwarm(np.linspace(0, 1, len(bars)))
-            for bar, color in zip(bars, colors):
+            for bar, color in zip(bars, _gradient('coolwarm', len(bars))):
                 bar.set_color(color)
             
             # Add value labels on bars
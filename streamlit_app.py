@@ -5,12 +5,14 @@ Streamlit Application for CORD-19 Data Explorer
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import seaborn as sns
 import sys
 import os
+import io
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add src directory to path
@@ -46,48 +48,282 @@ st.markdown("""
         text-align: center;
         margin: 0.5rem 0;
     }
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+    }
+    .metric-row .metric-card {
+        flex: 1;
+    }
     .stTabs [data-baseweb="tab-list"] {
         gap: 2px;
     }
 </style>
 """, unsafe_allow_html=True)
 
-# Cache data loading functions
-@st.cache_data
+# Cleaned data files
+CLEANED_CSV = 'data/cleaned_metadata.csv'
+CLEANED_PARQUET = 'data/cleaned_metadata.parquet'
+RAW_CSV = 'data/metadata.csv'
+
+# Cleaned demo sample of the raw data, kept apart from the cleaned files so
+# it never stands in for them
+SAMPLE_PARQUET = 'data/cleaned_sample.parquet'
+
+def is_stale(path, source):
+    """Check whether path is missing or older than the file it is derived from"""
+    return not os.path.exists(path) or os.path.getmtime(source) > os.path.getmtime(path)
+
+def write_parquet(df, path):
+    """Write df to path as Parquet without ever leaving a partial file there"""
+    # Write next to the target and rename over it only once the file is complete
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def convert_cleaned_csv():
+    """Rewrite the cleaned CSV as Parquet with compact dtypes"""
+    df = pd.read_csv(CLEANED_CSV)
+    
+    # Repeated labels become categoricals, the year a nullable int16
+    for col in ['journal', 'source_x']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if 'publish_time_year' in df.columns:
+        df['publish_time_year'] = pd.to_numeric(df['publish_time_year'], errors='coerce').astype('Int16')
+    
+    write_parquet(df, CLEANED_PARQUET)
+
 def load_and_process_data():
     """Load and process the CORD-19 data"""
     try:
+        # Convert cleaned CSV to Parquet once, and again whenever the CSV is
+        # regenerated; later loads skip CSV parsing
+        if os.path.exists(CLEANED_CSV) and is_stale(CLEANED_PARQUET, CLEANED_CSV):
+            convert_cleaned_csv()
+        
+        df = None
+        
         # Try to load cleaned data first
-        if os.path.exists('data/cleaned_metadata.csv'):
-            df = pd.read_csv('data/cleaned_metadata.csv')
+        if os.path.exists(CLEANED_PARQUET):
+            df = pd.read_parquet(CLEANED_PARQUET, engine='pyarrow')
             st.success("✅ Loaded pre-processed data")
-        else:
+        # Otherwise reuse the cleaned sample unless the raw CSV changed since
+        elif os.path.exists(SAMPLE_PARQUET) and not (os.path.exists(RAW_CSV) and is_stale(SAMPLE_PARQUET, RAW_CSV)):
+            # An unreadable sample is simply cleaned again below
+            try:
+                df = pd.read_parquet(SAMPLE_PARQUET, engine='pyarrow')
+                st.success("✅ Loaded cached sample data")
+            except (OSError, ValueError) as e:
+                st.warning(f"⚠️ Could not read cached sample, re-cleaning: {str(e)}")
+        
+        if df is None:
             # Load and clean raw data
-            loader = DataLoader('data/metadata.csv')
+            loader = DataLoader(RAW_CSV)
             df = loader.load_data(sample_size=10000)  # Use sample for demo
             
             cleaner = DataCleaner(df)
             df = cleaner.get_cleaned_data()
             st.success("✅ Data loaded and processed successfully")
+            
+            # Save the cleaned sample so a restarted app skips CSV parsing and cleaning
+            try:
+                write_parquet(df, SAMPLE_PARQUET)
+            except OSError as e:
+                st.warning(f"⚠️ Could not save cleaned sample: {str(e)}")
+        
+        # Nullable int16 year keeps the year filter compact
+        if 'publish_time_year' in df.columns:
+            df['publish_time_year'] = pd.to_numeric(df['publish_time_year'], errors='coerce').astype('Int16')
+        
+        # Arrow-backed titles let the title search run in Arrow's string kernels
+        if 'title' in df.columns:
+            df['title'] = df['title'].astype('string[pyarrow]')
         
         return df
     except Exception as e:
         st.error(f"❌ Error loading data: {str(e)}")
         return None
 
-@st.cache_data
 def get_analysis_data(df):
-    """Get all analysis results"""
+    """Get all analysis results, running the analyses in parallel"""
     analyzer = DataAnalyzer(df)
     
-    return {
-        'basic_stats': analyzer.get_basic_statistics(),
-        'yearly_data': analyzer.analyze_publications_by_year(),
-        'journal_data': analyzer.get_top_journals(20),
-        'word_data': analyzer.analyze_title_words(50),
-        'source_data': analyzer.analyze_source_distribution(),
-        'monthly_data': analyzer.analyze_monthly_trends()
+    # The analyses only read df and spend most of their time in NumPy/Arrow
+    # kernels that release the GIL
+    with ThreadPoolExecutor() as pool:
+        futures = {
+            'basic_stats': pool.submit(analyzer.get_basic_statistics),
+            'yearly_data': pool.submit(analyzer.analyze_publications_by_year),
+            'journal_data': pool.submit(analyzer.get_top_journals, 20),
+            'word_data': pool.submit(analyzer.analyze_title_words, 50),
+            'source_data': pool.submit(analyzer.analyze_source_distribution),
+            'monthly_data': pool.submit(analyzer.analyze_monthly_trends)
+        }
+    analysis_data = {key: future.result() for key, future in futures.items()}
+    
+    # Year slicing relies on the yearly counts being sorted by year
+    if not analysis_data['yearly_data'].empty:
+        analysis_data['yearly_data'] = analysis_data['yearly_data'].sort_values('year')
+    
+    return analysis_data
+
+def build_lookups(df):
+    """Precompute the row lookups the year filter and metric cards reuse"""
+    lookups = {
+        'memory_mb': df.memory_usage(deep=True).sum() / 1024**2,
+        'incomplete_columns': [col for col in df.columns if df[col].isna().any()]
     }
+    
+    # Positions of the rows of each publication year (undated rows excluded)
+    if 'publish_time_year' in df.columns:
+        index = {int(year): rows for year, rows in df.groupby('publish_time_year').indices.items()}
+        lookups['year_index'] = index
+        lookups['year_bounds'] = (min(index), max(index)) if index else None
+        lookups['all_dated'] = sum(len(rows) for rows in index.values()) == len(df)
+    
+    # Titles factorized once into integer codes (-1 for missing)
+    if 'title' in df.columns:
+        lookups['title_codes'], uniques = pd.factorize(df['title'])
+        lookups['n_titles'] = len(uniques)
+    
+    return lookups
+
+# Cache data loading, analysis and lookups together. cache_resource hands
+# every rerun the same objects instead of a copy, so df, the analysis results
+# and the lookups must be treated as read-only; they live and die together.
+# cache_resource cannot persist to disk; the Parquet files written by
+# load_and_process_data cover restarts instead
+@st.cache_resource(show_spinner="Loading and processing data...")
+def bootstrap():
+    """Load the data, run all analyses and build the lookups as one cached step"""
+    df = load_and_process_data()
+    if df is None:
+        return None, None, None
+    
+    return df, get_analysis_data(df), build_lookups(df)
+
+# Chart builders return cached Plotly JSON specs so reruns with unchanged
+# inputs skip building the figure
+@st.cache_data(max_entries=16, show_spinner=False)
+def yearly_chart_spec(yearly_filtered, year_range):
+    """Build the yearly publications line chart as a Plotly JSON spec"""
+    # Drawn with the WebGL renderer (WebGL lines do not support spline smoothing)
+    fig = go.Figure(go.Scattergl(
+        x=yearly_filtered['year'],
+        y=yearly_filtered['publication_count'],
+        mode='lines+markers',
+        line=dict(width=3),
+        marker=dict(size=8),
+        hovertemplate='<b>Year:</b> %{x}<br><b>Publications:</b> %{y:,}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=f'COVID-19 Research Publications Over Time {f"({year_range[0]}-{year_range[1]})" if year_range else ""}',
+        height=500,
+        xaxis_title="Year",
+        yaxis_title="Number of Publications",
+        hovermode='x unified'
+    )
+    
+    return pio.to_json(fig)
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def monthly_chart_spec(monthly_data):
+    """Build the monthly publications bar chart as a Plotly JSON spec"""
+    fig = px.bar(
+        monthly_data,
+        x='month',
+        y='publication_count',
+        title='Publication Distribution by Month',
+        color='publication_count',
+        color_continuous_scale='viridis'
+    )
+    
+    fig.update_layout(height=400)
+    return pio.to_json(fig)
+
+def slice_years(yearly_data, lo, hi):
+    """Get the rows of year-sorted yearly_data between lo and hi (inclusive)"""
+    i, j = np.searchsorted(yearly_data['year'].to_numpy(), [lo, hi + 1])
+    return yearly_data.iloc[i:j]
+
+def approx_mem_mb(df, lookups, n_rows):
+    """Estimate the memory usage of n_rows of df, scaled from the full frame"""
+    if len(df) == 0:
+        return 0.0
+    return lookups['memory_mb'] * n_rows / len(df)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def make_wordcloud_png(items, n):
+    """Render a word cloud from (word, frequency) pairs as PNG bytes"""
+    from wordcloud import WordCloud
+    
+    wordcloud = WordCloud(
+        width=800, height=600,
+        background_color='white',
+        colormap='viridis',
+        max_words=n
+    ).generate_from_frequencies(dict(items))
+    
+    buf = io.BytesIO()
+    wordcloud.to_image().save(buf, format='PNG')
+    return buf.getvalue()
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def df_to_csv_bytes(df):
+    """Encode a DataFrame as UTF-8 CSV bytes for download"""
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def title_search(df, term):
+    """Get the rows whose title contains term (literal, case-insensitive)"""
+    return df[df['title'].str.contains(term, case=False, na=False, regex=False)]
+
+def covers_all_rows(lookups, year_range):
+    """Check whether year_range selects every row of the loaded data"""
+    return year_range is None or (lookups['all_dated'] and tuple(year_range) == lookups['year_bounds'])
+
+def select_year_rows(lookups, codes, year_range):
+    """Get the entries of the row-aligned array codes for rows in year_range"""
+    index = lookups['year_index']
+    parts = [codes[index[year]] for year in range(year_range[0], year_range[1] + 1) if year in index]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=codes.dtype)
+
+def filter_by_year(df, lookups, lo, hi):
+    """Get the rows published between lo and hi (inclusive)"""
+    if covers_all_rows(lookups, (lo, hi)):
+        return df
+    
+    # Gather the rows of each selected year instead of scanning the whole column.
+    # Deliberately not cached: a cache_data hit unpickles a copy of the slice,
+    # which costs more than this take touching only the selected rows
+    rows = np.sort(select_year_rows(lookups, np.arange(len(df)), (lo, hi)))
+    return df.take(rows)
+
+def count_unique_titles(lookups, year_range=None):
+    """Count distinct titles, optionally only among rows in year_range (inclusive)"""
+    if covers_all_rows(lookups, year_range):
+        return lookups['n_titles']
+    
+    # Count distinct integer codes of the selected rows instead of hashing strings
+    codes = select_year_rows(lookups, lookups['title_codes'], year_range)
+    counts = np.bincount(codes[codes >= 0], minlength=lookups['n_titles'])
+    return int(np.count_nonzero(counts))
+
+def count_complete_columns(df_filtered, lookups, year_range=None):
+    """Count columns of df_filtered with no missing values"""
+    # Columns complete in the full frame are complete in any subset, so only
+    # the incomplete ones need checking, one column at a time
+    incomplete = lookups['incomplete_columns']
+    n_complete = len(df_filtered.columns) - len(incomplete)
+    if covers_all_rows(lookups, year_range):
+        return n_complete
+    return n_complete + sum(1 for col in incomplete if not df_filtered[col].isna().any())
 
 def main():
     """Main Streamlit application"""
@@ -97,17 +333,19 @@ def main():
     st.markdown("**Exploring COVID-19 Research Papers Dataset**")
     st.markdown("---")
     
-    # Load data
-    with st.spinner("Loading and processing data..."):
-        df = load_and_process_data()
+    # Load data and analysis results
+    df, analysis_data, lookups = bootstrap()
     
     if df is None:
         st.error("Please ensure the data file is in the 'data' folder")
         st.stop()
     
-    # Get analysis data
-    with st.spinner("Performing analysis..."):
-        analysis_data = get_analysis_data(df)
+    # Timestamps are taken once per session for the footer and download file names
+    if 'run_date' not in st.session_state:
+        now = datetime.now()
+        st.session_state['run_date'] = now.strftime('%Y-%m-%d')
+        st.session_state['run_ts'] = now.strftime('%Y%m%d_%H%M')
+    run_ts = st.session_state['run_ts']
     
     # Sidebar controls
     st.sidebar.title("🔧 Controls")
@@ -115,19 +353,18 @@ def main():
     
     # Year filter
     if 'publish_time_year' in df.columns:
-        years = sorted(df['publish_time_year'].dropna().unique())
-        if len(years) > 1:
+        bounds = lookups['year_bounds']
+        if bounds and bounds[0] != bounds[1]:
             year_range = st.sidebar.slider(
                 "Select Year Range",
-                min_value=int(min(years)),
-                max_value=int(max(years)),
-                value=(int(min(years)), int(max(years))),
+                min_value=bounds[0],
+                max_value=bounds[1],
+                value=bounds,
                 step=1
             )
             
             # Filter data based on year selection
-            mask = (df['publish_time_year'] >= year_range[0]) & (df['publish_time_year'] <= year_range[1])
-            df_filtered = df[mask]
+            df_filtered = filter_by_year(df, lookups, year_range[0], year_range[1])
         else:
             df_filtered = df
             year_range = None
@@ -163,37 +400,24 @@ def main():
         st.header("Dataset Overview")
         
         # Key metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(
-                f'<div class="metric-card"><h3>{len(df_filtered):,}</h3><p>Total Papers</p></div>',
-                unsafe_allow_html=True
-            )
+        unique_titles = count_unique_titles(lookups, year_range) if 'title' in df.columns else 0
         
-        with col2:
-            unique_titles = df_filtered['title'].nunique() if 'title' in df_filtered.columns else 0
-            st.markdown(
-                f'<div class="metric-card"><h3>{unique_titles:,}</h3><p>Unique Titles</p></div>',
-                unsafe_allow_html=True
-            )
+        if 'publish_time_year' in df_filtered.columns:
+            years_span = f"{df_filtered['publish_time_year'].min():.0f}-{df_filtered['publish_time_year'].max():.0f}"
+        else:
+            years_span = "N/A"
         
-        with col3:
-            if 'publish_time_year' in df_filtered.columns:
-                years_span = f"{df_filtered['publish_time_year'].min():.0f}-{df_filtered['publish_time_year'].max():.0f}"
-            else:
-                years_span = "N/A"
-            st.markdown(
-                f'<div class="metric-card"><h3>{years_span}</h3><p>Year Range</p></div>',
-                unsafe_allow_html=True
-            )
+        avg_abstract = analysis_data['basic_stats'].get('avg_abstract_length', 0)
         
-        with col4:
-            avg_abstract = analysis_data['basic_stats'].get('avg_abstract_length', 0)
-            st.markdown(
-                f'<div class="metric-card"><h3>{avg_abstract:.0f}</h3><p>Avg Abstract Length</p></div>',
-                unsafe_allow_html=True
-            )
+        # All four cards go out in one flex row and a single markdown element
+        metrics = [
+            (f"{len(df_filtered):,}", "Total Papers"),
+            (f"{unique_titles:,}", "Unique Titles"),
+            (years_span, "Year Range"),
+            (f"{avg_abstract:.0f}", "Avg Abstract Length")
+        ]
+        cards = ''.join(f'<div class="metric-card"><h3>{value}</h3><p>{label}</p></div>' for value, label in metrics)
+        st.markdown(f'<div class="metric-row">{cards}</div>', unsafe_allow_html=True)
         
         st.markdown("---")
         
@@ -205,10 +429,7 @@ def main():
             
             yearly_data = analysis_data['yearly_data']
             if not yearly_data.empty and year_range:
-                yearly_filtered = yearly_data[
-                    (yearly_data['year'] >= year_range[0]) & 
-                    (yearly_data['year'] <= year_range[1])
-                ]
+                yearly_filtered = slice_years(yearly_data, year_range[0], year_range[1])
                 
                 if not yearly_filtered.empty:
                     peak_year = yearly_filtered.loc[yearly_filtered['publication_count'].idxmax()]
@@ -224,15 +445,15 @@ def main():
             st.subheader("🔍 Data Quality")
             
             total_columns = len(df_filtered.columns)
-            complete_columns = (df_filtered.isnull().sum() == 0).sum()
+            complete_columns = count_complete_columns(df_filtered, lookups, year_range)
             completeness = complete_columns / total_columns * 100
             
             st.write(f" **Total Columns:** {total_columns}")
             st.write(f" **Complete Columns:** {complete_columns}")
             st.write(f" **Data Completeness:** {completeness:.1f}%")
             
-            # Memory usage
-            memory_mb = df_filtered.memory_usage(deep=True).sum() / 1024**2
+            # Memory usage (estimated from the full-frame figure)
+            memory_mb = approx_mem_mb(df, lookups, len(df_filtered))
             st.write(f" **Memory Usage:** {memory_mb:.2f} MB")
     
     # Tab 2: Publication Trends
@@ -242,36 +463,12 @@ def main():
         yearly_data = analysis_data['yearly_data']
         if not yearly_data.empty:
             if year_range:
-                yearly_filtered = yearly_data[
-                    (yearly_data['year'] >= year_range[0]) & 
-                    (yearly_data['year'] <= year_range[1])
-                ]
+                yearly_filtered = slice_years(yearly_data, year_range[0], year_range[1])
             else:
                 yearly_filtered = yearly_data
             
             # Interactive plot using Plotly
-            fig = px.line(
-                yearly_filtered, 
-                x='year', 
-                y='publication_count',
-                title=f'COVID-19 Research Publications Over Time {f"({year_range[0]}-{year_range[1]})" if year_range else ""}',
-                markers=True,
-                line_shape='spline'
-            )
-            
-            fig.update_traces(
-                line=dict(width=3),
-                marker=dict(size=8),
-                hovertemplate='<b>Year:</b> %{x}<br><b>Publications:</b> %{y:,}<extra></extra>'
-            )
-            
-            fig.update_layout(
-                height=500,
-                xaxis_title="Year",
-                yaxis_title="Number of Publications",
-                hovermode='x unified'
-            )
-            
+            fig = pio.from_json(yearly_chart_spec(yearly_filtered, year_range))
             st.plotly_chart(fig, use_container_width=True)
             
             # Show data table
@@ -285,16 +482,7 @@ def main():
         if not monthly_data.empty:
             st.subheader("Monthly Publication Patterns")
             
-            fig_monthly = px.bar(
-                monthly_data,
-                x='month',
-                y='publication_count',
-                title='Publication Distribution by Month',
-                color='publication_count',
-                color_continuous_scale='viridis'
-            )
-            
-            fig_monthly.update_layout(height=400)
+            fig_monthly = pio.from_json(monthly_chart_spec(monthly_data))
             st.plotly_chart(fig_monthly, use_container_width=True)
     
     # Tab 3: Top Journals
@@ -306,33 +494,24 @@ def main():
             # Filter based on user selection
             top_journals = journal_data.head(n_journals)
             
-            # Interactive bar chart
-            fig = px.bar(
+            # Ranked table with in-cell bars; lighter than a Plotly figure for
+            # at most 20 rows and doubles as the data view
+            st.subheader(f"Top {n_journals} Journals by Publication Count")
+            st.dataframe(
                 top_journals,
-                y='journal',
-                x='publication_count',
-                orientation='h',
-                title=f'Top {n_journals} Journals by Publication Count',
-                color='publication_count',
-                color_continuous_scale='plasma'
+                column_config={
+                    'journal': st.column_config.TextColumn("Journal"),
+                    'publication_count': st.column_config.ProgressColumn(
+                        "Number of Publications",
+                        format="%d",
+                        min_value=0,
+                        max_value=int(top_journals['publication_count'].max())
+                    )
+                },
+                hide_index=True,
+                use_container_width=True,
+                height=(len(top_journals) + 1) * 35 + 3
             )
-            
-            fig.update_layout(
-                height=max(400, n_journals * 30),
-                yaxis=dict(tickmode='linear'),
-                xaxis_title="Number of Publications",
-                yaxis_title="Journal"
-            )
-            
-            fig.update_traces(
-                hovertemplate='<b>%{y}</b><br>Publications: %{x:,}<extra></extra>'
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Show data table
-            with st.expander(" View Journal Data"):
-                st.dataframe(top_journals, use_container_width=True)
         else:
             st.warning("No journal data available")
     
@@ -347,25 +526,15 @@ def main():
             with col1:
                 st.subheader("Word Cloud")
                 
-                # Create word cloud using matplotlib (since plotly doesn't have native word cloud)
+                # Word cloud rendered once per word list and size, then served as PNG.
+                # Rendered wider than the column so it fills it at its native width
                 try:
-                    from wordcloud import WordCloud
-                    
-                    word_freq = dict(zip(word_data['word'][:n_words], word_data['frequency'][:n_words]))
-                    
-                    wordcloud = WordCloud(
-                        width=400, height=300,
-                        background_color='white',
-                        colormap='viridis',
-                        max_words=n_words
-                    ).generate_from_frequencies(word_freq)
+                    items = tuple(zip(word_data['word'][:n_words], word_data['frequency'][:n_words].tolist()))
                     
-                    fig_wc, ax = plt.subplots(figsize=(8, 6))
-                    ax.imshow(wordcloud, interpolation='bilinear')
-                    ax.axis('off')
-                    ax.set_title('Most Frequent Words in Paper Titles', fontsize=14, fontweight='bold')
-                    
-                    st.pyplot(fig_wc)
+                    st.image(
+                        make_wordcloud_png(items, n_words),
+                        caption='Most Frequent Words in Paper Titles'
+                    )
                     
                 except ImportError:
                     st.error("WordCloud library not available. Please install it: pip install wordcloud")
@@ -373,29 +542,26 @@ def main():
             with col2:
                 st.subheader("Top Words")
                 
-                # Bar chart of top words
+                # Ranked table with in-cell frequency bars
                 top_words = word_data.head(n_words)
                 
-                fig_words = px.bar(
+                st.dataframe(
                     top_words,
-                    x='frequency',
-                    y='word',
-                    orientation='h',
-                    title=f'Top {min(n_words, len(top_words))} Most Frequent Words',
-                    color='frequency',
-                    color_continuous_scale='blues'
-                )
-                
-                fig_words.update_layout(
-                    height=max(400, len(top_words) * 20),
-                    yaxis=dict(categoryorder='total ascending'),
-                    xaxis_title="Frequency",
-                    yaxis_title="Word"
+                    column_config={
+                        'word': st.column_config.TextColumn("Word"),
+                        'frequency': st.column_config.ProgressColumn(
+                            "Frequency",
+                            format="%d",
+                            min_value=0,
+                            max_value=int(top_words['frequency'].max())
+                        )
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                    height=400
                 )
-                
-                st.plotly_chart(fig_words, use_container_width=True)
             
-            # Show word frequency table
+            # Full top-50 list, independent of the word cloud size
             with st.expander("📊 View Word Frequency Data"):
                 st.dataframe(word_data.head(50), use_container_width=True)
         else:
@@ -428,15 +594,11 @@ def main():
                 placeholder="Enter search term..."
             )
         
-        # Apply filters
-        display_df = df_filtered.copy()
-        
-        if show_columns:
-            display_df = display_df[show_columns]
+        # Apply filters; selecting columns directly avoids copying the whole frame
+        display_df = df_filtered[show_columns] if show_columns else df_filtered
         
         if search_term and 'title' in display_df.columns:
-            mask = display_df['title'].str.contains(search_term, case=False, na=False)
-            display_df = display_df[mask]
+            display_df = title_search(display_df, search_term)
             st.info(f"Found {len(display_df)} papers containing '{search_term}'")
         
         # Display data
@@ -453,22 +615,22 @@ def main():
         
         with col1:
             # Download filtered data as CSV
-            csv = display_df.to_csv(index=False)
+            csv = df_to_csv_bytes(display_df)
             st.download_button(
                 label=" Download Filtered Data as CSV",
                 data=csv,
-                file_name=f"cord19_filtered_data_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                file_name=f"cord19_filtered_data_{run_ts}.csv",
                 mime="text/csv"
             )
         
         with col2:
             # Download analysis results
             if not analysis_data['yearly_data'].empty:
-                yearly_csv = analysis_data['yearly_data'].to_csv(index=False)
+                yearly_csv = df_to_csv_bytes(analysis_data['yearly_data'])
                 st.download_button(
                     label=" Download Analysis Results",
                     data=yearly_csv,
-                    file_name=f"cord19_yearly_analysis_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                    file_name=f"cord19_yearly_analysis_{run_ts}.csv",
                     mime="text/csv"
                 )
     
@@ -483,7 +645,7 @@ def main():
         st.info(" **Built with:** Python, Streamlit, Pandas, Plotly")
     
     with col3:
-        st.info(" **Last Updated:** " + datetime.now().strftime("%Y-%m-%d"))
+        st.info(" **Last Updated:** " + st.session_state['run_date'])
     
     # Sidebar additional info
     with st.sidebar:
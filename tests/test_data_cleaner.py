@@ -0,0 +1,25 @@
+"""
+Regression checks for DataCleaner text handling
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# Import the modules the same way the app does
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_cleaner import DataCleaner
+
+# Every character str.split() treats as whitespace but RE2's \s does not
+SPLIT_ONLY_WHITESPACE = ['\x0b', '\x1c', '\x1d', '\x1e', '\x1f', '\x85', '\xa0', ' ', '　']
+
+
+def test_clean_text_columns_keeps_unicode_whitespace_as_word_break():
+    texts = [f'Hello{ws}world' for ws in SPLIT_ONLY_WHITESPACE]
+    cleaner = DataCleaner(pd.DataFrame({'title': texts, 'abstract': texts}))
+    cleaner.clean_text_columns()
+
+    for col in ['title', 'abstract']:
+        assert cleaner.df[col].tolist() == ['Hello world'] * len(texts)